@@ -6,11 +6,12 @@ with consistent branding across multiple aspect ratios.
 """
 
 import streamlit as st
+import functools
 import json
 import os
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from pathlib import Path
 from PIL import Image
 
 from pipeline.models import CampaignBrief, BrandConfig
@@ -18,43 +19,34 @@ from pipeline.generator import generate_campaign_creatives, load_brand_config
 from pipeline.background_generator import get_available_regions
 from pipeline.aspect_ratios import get_aspect_ratio_info
 
+EXAMPLE_BRIEF_PATH = "examples/campaign_brief.json"
+PRODUCTS_DIR = "assets/products"
+PREVIEW_MAX_SIZE = (512, 512)  # Previews are shown in narrow columns
+
+# UI stylesheet, read once at import; a missing file only drops the styling
+try:
+    with open(os.path.join(os.path.dirname(__file__), "static", "app.css")) as f:
+        _APP_CSS = f.read()
+except OSError:
+    _APP_CSS = ""
+
+# Sidebar listings are static, so build them once at import
+_REGIONS_MD = "\n".join(
+    f"- {region.replace('_', ' ').title()}" for region in get_available_regions()
+)
+_FORMATS_MD = "\n".join(
+    f"- {name}: {config.width}x{config.height}"
+    for name, config in get_aspect_ratio_info().items()
+)
+
 # Page config
 st.set_page_config(
     page_title="Iron Leaf Creative Automation", page_icon="🍃", layout="wide"
 )
 
-# Custom CSS for better styling
-st.markdown(
-    """
-<style>
-    .stApp {
-        background-color: #1a1a1a;
-    }
-    .main-header {
-        color: #5C4033;
-        font-size: 3.5rem;
-        font-weight: bold;
-        margin-bottom: 0;
-    }
-    .sub-header {
-        color: #5C4033;
-        font-size: 2.1rem;
-        margin-top: 0;
-        opacity: 0.8;
-    }
-    .product-card {
-        background-color: #2d2d2d;
-        border-radius: 10px;
-        padding: 15px;
-        margin: 10px 0;
-    }
-    .stMainBlockContainer {
-        background-color: #fff;
-    }
-</style>
-""",
-    unsafe_allow_html=True,
-)
+# Custom CSS for better styling. Inlined rather than linked: Streamlit's static
+# file handler serves .css as text/plain on older releases, which browsers reject
+st.markdown(f"<style>\n{_APP_CSS}</style>", unsafe_allow_html=True)
 
 # Header
 st.markdown(
@@ -67,6 +59,135 @@ st.markdown(
 )
 st.divider()
 
+
+@st.cache_data(show_spinner=False)
+def _load_json_cached(path: str, mtime: float) -> dict:
+    """Load a JSON file; mtime is part of the cache key so edits invalidate it."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+@st.cache_data(show_spinner=False)
+def _load_brand_config_cached(path: str, mtime: float) -> BrandConfig:
+    """Load and validate brand configuration, cached per path + mtime."""
+    return load_brand_config(path)
+
+
+def load_json(path: str) -> dict:
+    """Load a JSON file, reusing the parsed result across reruns."""
+    return _load_json_cached(path, os.path.getmtime(path))
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _load_preview_bytes(path: str, mtime: float) -> bytes:
+    """Decode, downscale and PNG-encode an image once for repeated display."""
+    buf = BytesIO()
+    with Image.open(path) as img:
+        # Let libjpeg decode straight at a reduced DCT scale; thumbnail() alone
+        # only drafts to twice the preview size. Other formats ignore draft()
+        if img.format == "JPEG":
+            img.draft("RGB", PREVIEW_MAX_SIZE)
+        img.thumbnail(PREVIEW_MAX_SIZE)
+        # PNG can't store modes like CMYK or I;16
+        if img.mode not in ("RGB", "RGBA", "L", "LA", "P"):
+            img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+        img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+def load_preview(path: str) -> bytes:
+    """Return display-ready PNG bytes for an image, cached per path + mtime."""
+    return _load_preview_bytes(path, os.path.getmtime(path))
+
+
+# Each generation has a new manifest, so keep only the last few archives
+@st.cache_data(show_spinner=False, max_entries=4)
+def _build_zip(manifest: tuple[tuple[str, str, float, int], ...]) -> bytes:
+    """Zip generated creatives; manifest entries are (arcname, path, mtime, size)."""
+    zip_buffer = BytesIO()
+    # Creatives are already-compressed PNGs, so store rather than deflate them
+    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_STORED) as zip_file:
+        for arcname, path, _mtime, _size in manifest:
+            zip_file.write(path, arcname)
+    return zip_buffer.getvalue()
+
+
+@st.cache_resource
+def _get_executor() -> ThreadPoolExecutor:
+    """Worker pool shared by all sessions for long-running generation jobs."""
+    return ThreadPoolExecutor(max_workers=4)
+
+
+def _start_generation(brief: CampaignBrief, brand_config: BrandConfig) -> None:
+    """Submit a generation job and track it in the session state."""
+    job = {"brief": brief, "message": "Starting generation...", "percent": 0.0}
+
+    def update_progress(message, percent):
+        # Runs on the worker thread, so only record state here; the
+        # progress fragment renders it
+        job["message"] = message
+        job["percent"] = percent
+
+    job["future"] = _get_executor().submit(
+        generate_campaign_creatives,
+        brief=brief,
+        brand_config=brand_config,
+        output_dir="output",
+        progress_callback=update_progress,
+    )
+    st.session_state["generation_job"] = job
+
+
+@st.fragment(run_every=0.5)
+def _render_generation_progress() -> None:
+    """Show progress of the running job; only this fragment reruns while polling."""
+    job = st.session_state["generation_job"]
+    if job["future"].done():
+        # Rerun the whole page to swap progress for results
+        st.rerun()
+
+    st.progress(job["percent"])
+    st.text(job["message"])
+
+
+@st.fragment
+def _render_product_previews() -> None:
+    """Product image previews for the current brief, isolated from other reruns."""
+    brief_data = st.session_state.get("brief_data")
+    if brief_data and "products" in brief_data:
+        preview_cols = st.columns(len(brief_data["products"]))
+        for i, product in enumerate(brief_data["products"]):
+            with preview_cols[i]:
+                if os.path.exists(product["product_image"]):
+                    st.image(
+                        load_preview(product["product_image"]),
+                        caption=product["name"],
+                        width="stretch",
+                    )
+                else:
+                    st.warning(f"Image not found: {product['product_image']}")
+
+
+@st.fragment
+def _render_creatives(brief: CampaignBrief, results: dict[str, list[str]]) -> None:
+    """Grid of generated creatives (paths must exist), isolated from other reruns."""
+    # Create a mapping from product_id to product name
+    product_name_map = {p.id: p.name for p in brief.products}
+
+    for product_id, file_paths in results.items():
+        # Use product name from the products array, fallback to formatted product_id
+        product_name = product_name_map.get(
+            product_id, product_id.replace("-", " ").title()
+        )
+        st.subheader(product_name)
+
+        cols = st.columns(3)
+        for i, path in enumerate(file_paths):
+            with cols[i % 3]:
+                ratio_name = os.path.splitext(os.path.basename(path))[0]
+                st.image(load_preview(path), caption=ratio_name, width="stretch")
+
+
 # Sidebar - Configuration
 with st.sidebar:
     st.header("⚙️ Configuration")
@@ -80,7 +201,9 @@ with st.sidebar:
 
     # Load brand config
     try:
-        brand_config = load_brand_config(brand_config_path)
+        brand_config = _load_brand_config_cached(
+            brand_config_path, os.path.getmtime(brand_config_path)
+        )
         st.success(f"✓ Loaded {brand_config.brand_name} brand config")
     except Exception as e:
         st.error(f"Error loading brand config: {e}")
@@ -90,16 +213,13 @@ with st.sidebar:
 
     # Available regions
     st.subheader("Available Regions")
-    regions = get_available_regions()
-    for region in regions:
-        st.text(f"• {region.replace('_', ' ').title()}")
+    st.markdown(_REGIONS_MD)
 
     st.divider()
 
     # Aspect ratio info
     st.subheader("Output Formats")
-    for name, config in get_aspect_ratio_info().items():
-        st.text(f"• {name}: {config.width}x{config.height}")
+    st.markdown(_FORMATS_MD)
 
 # Main content area
 col1, col2 = st.columns([1, 1])
@@ -113,10 +233,8 @@ with col1:
     )
 
     if brief_source == "Use Example":
-        example_path = "examples/campaign_brief.json"
-        if os.path.exists(example_path):
-            with open(example_path, "r") as f:
-                brief_data = json.load(f)
+        if os.path.exists(EXAMPLE_BRIEF_PATH):
+            brief_data = load_json(EXAMPLE_BRIEF_PATH)
             st.json(brief_data)
         else:
             st.warning("Example brief not found. Please upload a brief.")
@@ -145,38 +263,42 @@ with col1:
         # Products
         st.subheader("Products")
 
-        # Find available product images
-        products_dir = Path("assets/products")
-        product_images = (
-            list(products_dir.glob("*.png")) if products_dir.exists() else []
-        )
+        # Find available product images in a single directory pass
+        product_images = []
+        if os.path.isdir(PRODUCTS_DIR):
+            with os.scandir(PRODUCTS_DIR) as entries:
+                product_images = sorted(
+                    (e for e in entries if e.name.endswith(".png") and e.is_file()),
+                    key=lambda e: e.name,
+                )
+
+        # Index example brief products by image filename so each product image
+        # can pick up its default name/description with a single lookup
+        example_products = {}
+        if os.path.exists(EXAMPLE_BRIEF_PATH):
+            try:
+                example_brief = load_json(EXAMPLE_BRIEF_PATH)
+                for prod in example_brief.get("products", []):
+                    image_name = os.path.basename(prod.get("product_image", ""))
+                    example_products.setdefault(image_name, prod)
+            except Exception:
+                pass  # If example brief can't be loaded, use defaults
 
         products = []
-        for i, img_path in enumerate(product_images):
-            # Try to find matching product name from example brief if it exists
-            default_name = img_path.stem.replace("-", " ").title()
-            default_desc = f"Premium {img_path.stem}"
-
-            # Check if example brief exists and has matching product
-            example_path = "examples/campaign_brief.json"
-            if os.path.exists(example_path):
-                try:
-                    with open(example_path, "r") as f:
-                        example_brief = json.load(f)
-                        # Try to match by image filename
-                        for prod in example_brief.get("products", []):
-                            if prod.get("product_image", "").endswith(img_path.name):
-                                default_name = prod.get("name", default_name)
-                                default_desc = prod.get("description", default_desc)
-                                break
-                except:
-                    pass  # If example brief can't be loaded, use defaults
+        for i, entry in enumerate(product_images):
+            stem = os.path.splitext(entry.name)[0]
+            default_name = stem.replace("-", " ").title()
+            default_desc = f"Premium {stem}"
+
+            # Use matching product from the example brief if it exists
+            prod = example_products.get(entry.name)
+            if prod:
+                default_name = prod.get("name", default_name)
+                default_desc = prod.get("description", default_desc)
 
             # Use product name for expander title if it's not just the filename
             display_name = (
-                default_name
-                if default_name != img_path.stem.replace("-", " ").title()
-                else img_path.stem
+                default_name if default_name != stem.replace("-", " ").title() else stem
             )
             with st.expander(f"Product {i+1}: {display_name}"):
                 name = st.text_input(
@@ -191,10 +313,10 @@ with col1:
                 )
                 products.append(
                     {
-                        "id": img_path.stem,
+                        "id": stem,
                         "name": name,
                         "description": desc,
-                        "product_image": str(img_path),
+                        "product_image": entry.path,
                     }
                 )
 
@@ -213,15 +335,8 @@ with col1:
 with col2:
     st.header("Product Preview")
 
-    if brief_data and "products" in brief_data:
-        preview_cols = st.columns(len(brief_data["products"]))
-        for i, product in enumerate(brief_data["products"]):
-            with preview_cols[i]:
-                if os.path.exists(product["product_image"]):
-                    img = Image.open(product["product_image"])
-                    st.image(img, caption=product["name"], width="stretch")
-                else:
-                    st.warning(f"Image not found: {product['product_image']}")
+    st.session_state["brief_data"] = brief_data
+    _render_product_previews()
 
 st.divider()
 
@@ -229,80 +344,70 @@ st.divider()
 st.header("Generate Creatives")
 
 if brief_data and brand_config:
-    if st.button("Generate Campaign Creatives", type="primary", width="stretch"):
+    job = st.session_state.get("generation_job")
+    running = job is not None and not job["future"].done()
+
+    if st.button(
+        "Generate Campaign Creatives",
+        type="primary",
+        width="stretch",
+        disabled=running,
+    ):
         try:
             # Validate brief
             brief = CampaignBrief(**brief_data)
+        except Exception as e:
+            st.error(f"Invalid campaign brief: {e}")
+        else:
+            # Generate in the background; the progress fragment polls the job
+            _start_generation(brief, brand_config)
+            st.rerun()
+
+    if running:
+        _render_generation_progress()
+    elif job is not None:
+        error = job["future"].exception()
+        if error is not None:
+            st.error(f"Error generating creatives: {error}")
+            st.exception(error)
+        else:
+            brief = job["brief"]
+            results = job["future"].result()
 
-            # Progress tracking
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-
-            def update_progress(message, percent):
-                progress_bar.progress(percent)
-                status_text.text(message)
-
-            # Generate!
-            with st.spinner("Generating creatives..."):
-                results = generate_campaign_creatives(
-                    brief=brief,
-                    brand_config=brand_config,
-                    output_dir="output",
-                    progress_callback=update_progress,
-                )
-
-            progress_bar.progress(1.0)
-            status_text.text("✅ Generation complete!")
-
-            st.success(f"Generated {sum(len(v) for v in results.values())} creatives!")
+            # Single pass over the results: one stat per file drives the
+            # count, the grid and the ZIP manifest
+            existing = {}
+            manifest = []
+            for product_id, file_paths in results.items():
+                existing[product_id] = []
+                for path in file_paths:
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    existing[product_id].append(path)
+                    arcname = f"{product_id}/{os.path.basename(path)}"
+                    manifest.append((arcname, path, stat.st_mtime, stat.st_size))
+
+            st.success(f"Generated {len(manifest)} creatives!")
 
             # Display results
             st.header("📸 Generated Creatives")
 
-            # Create a mapping from product_id to product name
-            product_name_map = {p.id: p.name for p in brief.products}
-
-            for product_id, file_paths in results.items():
-                # Use product name from the products array, fallback to formatted product_id
-                product_name = product_name_map.get(
-                    product_id, product_id.replace("-", " ").title()
-                )
-                st.subheader(product_name)
-
-                cols = st.columns(3)
-                for i, path in enumerate(file_paths):
-                    with cols[i % 3]:
-                        if os.path.exists(path):
-                            img = Image.open(path)
-                            ratio_name = Path(path).stem
-                            st.image(img, caption=ratio_name, width="stretch")
+            _render_creatives(brief, existing)
 
             # Download ZIP
             st.divider()
             st.subheader("📦 Download All")
 
-            # Create ZIP in memory
-            zip_buffer = BytesIO()
-            with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-                for product_id, file_paths in results.items():
-                    for path in file_paths:
-                        if os.path.exists(path):
-                            arcname = f"{product_id}/{Path(path).name}"
-                            zip_file.write(path, arcname)
-
-            zip_buffer.seek(0)
-
             st.download_button(
                 label="⬇️ Download All Creatives (ZIP)",
-                data=zip_buffer,
+                # Build the archive only when the button is clicked
+                data=functools.partial(_build_zip, tuple(manifest)),
                 file_name=f"{brief.campaign_name.lower().replace(' ', '_')}_creatives.zip",
                 mime="application/zip",
                 width="stretch",
             )
-
-        except Exception as e:
-            st.error(f"Error generating creatives: {e}")
-            st.exception(e)
 else:
     if not brief_data:
         st.warning("Please provide a campaign brief above.")
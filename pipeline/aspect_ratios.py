@@ -6,6 +6,12 @@ from PIL import Image
 from typing import Tuple, Dict
 from dataclasses import dataclass
 
+try:
+    # Optional: libvips fuses resize + crop in a streaming, threaded pipeline
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
+
 
 @dataclass
 class AspectRatioConfig:
@@ -34,6 +40,55 @@ ASPECT_RATIOS: Dict[str, AspectRatioConfig] = {
 }
 
 
+def _cover_size(
+    width: int, height: int, target_width: int, target_height: int
+) -> Tuple[int, int]:
+    """Size to scale an image to so it COVERS the target (fill completely, crop excess)."""
+    # Compare aspect ratios by cross-multiplying, keeping all math in integers
+    if width * target_height > target_width * height:
+        # Image is wider than target - scale by height to fill, will crop width
+        return (width * target_height + height // 2) // height, target_height
+
+    # Image is taller/narrower than target - scale by width to fill, will crop height
+    return target_width, (height * target_width + width // 2) // width
+
+
+def _resize_to_cover(
+    image: Image.Image, new_width: int, new_height: int
+) -> Image.Image:
+    """Resize image to its cover dimensions with a filter suited to the scale."""
+    # For modest scale changes BICUBIC is visually indistinguishable from
+    # LANCZOS at a fraction of the cost
+    scale = new_width / image.width
+    if 0.5 <= scale <= 2.0:
+        return image.resize((new_width, new_height), Image.Resampling.BICUBIC)
+
+    # For heavy downscales, reducing_gap does a cheap integer BOX reduction
+    # before the LANCZOS pass
+    return image.resize(
+        (new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=2.0
+    )
+
+
+def _crop_cover(
+    resized: Image.Image, target_width: int, target_height: int, focus: str
+) -> Image.Image:
+    """Crop a cover-sized image down to exactly the target dimensions."""
+    new_width, new_height = resized.size
+
+    # Cover sizing guarantees both dimensions are at least the target size;
+    # always center horizontally, crop vertically based on focus
+    left = max(0, (new_width - target_width) // 2)
+    if focus == "top":
+        top = 0
+    elif focus == "bottom":
+        top = max(0, new_height - target_height)
+    else:  # center
+        top = max(0, (new_height - target_height) // 2)
+
+    return resized.crop((left, top, left + target_width, top + target_height))
+
+
 def resize_and_crop(
     image: Image.Image, target_width: int, target_height: int, focus: str = "center"
 ) -> Image.Image:
@@ -50,50 +105,32 @@ def resize_and_crop(
     Returns:
         Resized and cropped image at exactly target_width x target_height
     """
-    # Calculate scaling to COVER target dimensions (fill completely, crop excess)
-    img_ratio = image.width / image.height
-    target_ratio = target_width / target_height
+    new_width, new_height = _cover_size(
+        image.width, image.height, target_width, target_height
+    )
+    resized = _resize_to_cover(image, new_width, new_height)
+    return _crop_cover(resized, target_width, target_height, focus)
 
-    if img_ratio > target_ratio:
-        # Image is wider than target - scale by height to fill, will crop width
-        new_height = target_height
-        new_width = int(image.width * (target_height / image.height))
-    else:
-        # Image is taller/narrower than target - scale by width to fill, will crop height
-        new_width = target_width
-        new_height = int(image.height * (target_width / image.width))
-
-    # Resize to cover dimensions
-    resized = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-    # Calculate crop box to get exact target dimensions
-    if new_width >= target_width:
-        # Crop horizontally (center)
-        left = (new_width - target_width) // 2
-        right = left + target_width
-    else:
-        # This shouldn't happen with cover logic, but handle it
-        left = 0
-        right = new_width
-
-    if new_height >= target_height:
-        # Crop vertically based on focus
-        if focus == "top":
-            top = 0
-            bottom = target_height
-        elif focus == "bottom":
-            top = new_height - target_height
-            bottom = new_height
-        else:  # center
-            top = (new_height - target_height) // 2
-            bottom = top + target_height
-    else:
-        # This shouldn't happen with cover logic, but handle it
-        top = 0
-        bottom = new_height
 
-    cropped = resized.crop((left, top, right, bottom))
-    return cropped
+def _vips_resize_and_crop(
+    image: Image.Image, target_width: int, target_height: int
+) -> Image.Image:
+    """
+    Cover-resize and center-crop an image using libvips.
+
+    Equivalent to resize_and_crop(..., focus="center"), but libvips's thumbnail
+    operation does the resize and crop in one pass without a full-size
+    intermediate. Expects an RGB or RGBA image.
+    """
+    vips_image = pyvips.Image.new_from_memory(
+        image.tobytes(), image.width, image.height, len(image.getbands()), "uchar"
+    ).copy(interpretation="srgb")
+    thumbnail = vips_image.thumbnail_image(
+        target_width, height=target_height, crop="centre"
+    )
+    return Image.frombytes(
+        image.mode, (thumbnail.width, thumbnail.height), thumbnail.write_to_memory()
+    )
 
 
 def generate_all_aspect_ratios(
@@ -102,6 +139,13 @@ def generate_all_aspect_ratios(
     """
     Generate all standard aspect ratio versions of an image.
 
+    Uses libvips for center-cropped downscales when pyvips is installed, where
+    its shrink pipeline is several times faster than Pillow. Upscales stay on
+    Pillow, which is faster for those. Ratios that need the same cover size
+    share a single Pillow resize and differ only in the (cheap) crop. Other
+    modes are converted to RGB, or RGBA if they carry transparency, up front
+    so the output mode doesn't depend on which backend handled a ratio.
+
     Args:
         image: Source image (should be high resolution)
         focus: Where to focus crops ("center", "top", "bottom")
@@ -109,11 +153,26 @@ def generate_all_aspect_ratios(
     Returns:
         Dictionary mapping ratio names to cropped images
     """
+    if image.mode not in ("RGB", "RGBA"):
+        has_alpha = "A" in image.getbands() or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
     results = {}
+    canvases = {}  # cover size -> resized image, shared between ratios
 
     for ratio_name, config in ASPECT_RATIOS.items():
-        results[ratio_name] = resize_and_crop(
-            image, config.width, config.height, focus=focus
+        scale = max(config.width / image.width, config.height / image.height)
+        if pyvips is not None and focus == "center" and scale < 1:
+            results[ratio_name] = _vips_resize_and_crop(
+                image, config.width, config.height
+            )
+            continue
+
+        cover = _cover_size(image.width, image.height, config.width, config.height)
+        if cover not in canvases:
+            canvases[cover] = _resize_to_cover(image, *cover)
+        results[ratio_name] = _crop_cover(
+            canvases[cover], config.width, config.height, focus
         )
 
     return results
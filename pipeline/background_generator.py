@@ -3,122 +3,169 @@ DALL-E background generation with regional prompts.
 """
 
 import os
-import requests
-from io import BytesIO
+import asyncio
+import functools
+import hashlib
+import tempfile
+import threading
+import httpx
 from pathlib import Path
+from io import BytesIO
 from PIL import Image
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from dotenv import load_dotenv
 
 # Load .env from project root
 project_root = Path(__file__).parent.parent
 load_dotenv(project_root / ".env")
 
+# Generated backgrounds are cached on disk so repeat runs skip the paid API call
+BACKGROUND_CACHE_DIR = project_root / ".cache" / "bg"
 
-def get_openai_client() -> OpenAI:
-    """Get OpenAI client, with helpful error if API key is missing."""
+
+def _get_api_key() -> str:
+    """Get the OpenAI API key, with helpful error if it is missing."""
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         raise ValueError(
             "OPENAI_API_KEY not found. Please create a .env file in the project root with:\n"
             "OPENAI_API_KEY=your_key_here"
         )
-    return OpenAI(api_key=api_key)
+    return api_key
 
 
-# Regional background prompts - scenic backdrops for product overlay
-REGION_PROMPTS = {
+@functools.lru_cache(maxsize=1)
+def get_openai_client() -> OpenAI:
+    """Get the shared OpenAI client, with helpful error if API key is missing."""
+    return OpenAI(api_key=_get_api_key())
+
+
+@functools.lru_cache(maxsize=1)
+def get_async_openai_client() -> AsyncOpenAI:
+    """
+    Get the shared async OpenAI client, with helpful error if API key is missing.
+
+    Only use it on the loop from _get_event_loop(); its connection pool is tied
+    to the loop it first runs on.
+    """
+    return AsyncOpenAI(api_key=_get_api_key())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_download_client() -> httpx.AsyncClient:
+    """Shared HTTP client for image downloads, reusing connections between calls."""
+    return httpx.AsyncClient(timeout=60)
+
+
+_event_loop = None
+_event_loop_lock = threading.Lock()
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Long-lived event loop running in a daemon thread.
+
+    asyncio.run() would create and close a new loop per call, discarding the
+    shared clients' open connections (and TLS sessions) each time. Creation
+    is locked because generations start from several worker threads, and the
+    shared async clients must only ever see one loop.
+    """
+    global _event_loop
+    with _event_loop_lock:
+        if _event_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, daemon=True).start()
+            _event_loop = loop
+    return _event_loop
+
+
+# Shared tail appended to every regional prompt
+_PROMPT_TAIL = (
+    "image fills entire canvas with no black bars or borders, no letterboxing, "
+    "no people, no text, no products, no logos, no vignette, no frame"
+)
+
+# Regional scene descriptions - scenic backdrops for product overlay
+_REGION_SCENES = {
     # United States
     "us_pacific_northwest": (
         "Wide landscape photograph of United States Pacific Northwest forest hiking trail, misty atmosphere, "
-        "moss-covered trees and ferns, soft diffused natural lighting, photorealistic, "
-        "image fills entire canvas with no black bars or borders, no letterboxing, "
-        "no people, no text, no products, no logos, no vignette, no frame"
+        "moss-covered trees and ferns, soft diffused natural lighting, photorealistic"
     ),
     "us_southwest": (
         "Wide landscape photograph of United States Southwest desert hiking trail, "
-        "red rock formations and sandstone cliffs, warm golden hour lighting with soft shadows, photorealistic, "
-        "image fills entire canvas with no black bars or borders, no letterboxing, "
-        "no people, no text, no products, no logos, no vignette, no frame"
+        "red rock formations and sandstone cliffs, warm golden hour lighting with soft shadows, photorealistic"
     ),
     "us_northeast": (
         "Wide landscape photograph of United States Northeast forest hiking trail in autumn, "
-        "dense hardwood forest with red and orange fall foliage, warm afternoon sunlight filtering through trees, photorealistic, "
-        "image fills entire canvas with no black bars or borders, no letterboxing, "
-        "no people, no text, no products, no logos, no vignette, no frame"
+        "dense hardwood forest with red and orange fall foliage, warm afternoon sunlight filtering through trees, photorealistic"
     ),
     "us_rockies": (
         "Wide landscape photograph of United States Rocky Mountains hiking trail, "
-        "alpine meadow with wildflowers, dramatic mountain peaks, crisp clear mountain light, photorealistic, "
-        "image fills entire canvas with no black bars or borders, no letterboxing, "
-        "no people, no text, no products, no logos, no vignette, no frame"
+        "alpine meadow with wildflowers, dramatic mountain peaks, crisp clear mountain light, photorealistic"
     ),
     "us_midwest": (
         "Wide landscape photograph of United States Midwest hiking trail, "
         "rolling prairie grasslands with tall grasses, oak and maple woodlands, gentle hills, "
-        "soft natural light beneath a wide open sky, photorealistic, "
-        "image fills entire canvas with no black bars or borders, no letterboxing, "
-        "no people, no text, no products, no logos, no vignette, no frame"
+        "soft natural light beneath a wide open sky, photorealistic"
     ),
     # Global regions
     "alps_europe": (
         "Wide landscape photograph of European Alps hiking trail, "
-        "dramatic alpine peaks, green valleys, rocky paths, crisp high-altitude light, photorealistic, "
-        "image fills entire canvas with no black bars or borders, no letterboxing, "
-        "no people, no text, no products, no logos, no vignette, no frame"
+        "dramatic alpine peaks, green valleys, rocky paths, crisp high-altitude light, photorealistic"
     ),
     "scandinavia": (
         "Wide landscape photograph of Scandinavian wilderness hiking trail, "
-        "pine forests, rocky terrain, fjord landscape, cool soft daylight, photorealistic, "
-        "image fills entire canvas with no black bars or borders, no letterboxing, "
-        "no people, no text, no products, no logos, no vignette, no frame"
+        "pine forests, rocky terrain, fjord landscape, cool soft daylight, photorealistic"
     ),
     "patagonia": (
         "Wide landscape photograph of Patagonia hiking trail, "
-        "windswept plains, jagged mountain peaks, glacial valleys, dramatic moody natural light, photorealistic, "
-        "image fills entire canvas with no black bars or borders, no letterboxing, "
-        "no people, no text, no products, no logos, no vignette, no frame"
+        "windswept plains, jagged mountain peaks, glacial valleys, dramatic moody natural light, photorealistic"
     ),
     "new_zealand": (
         "Wide landscape photograph of New Zealand hiking trail, "
-        "lush green mountains, rolling hills, distant peaks, clean natural daylight, photorealistic, "
-        "image fills entire canvas with no black bars or borders, no letterboxing, "
-        "no people, no text, no products, no logos, no vignette, no frame"
+        "lush green mountains, rolling hills, distant peaks, clean natural daylight, photorealistic"
     ),
     "japan_alps": (
         "Wide landscape photograph of Japanese Alps hiking trail, "
-        "forested mountain slopes, rocky paths, misty atmosphere, soft morning light, photorealistic, "
-        "image fills entire canvas with no black bars or borders, no letterboxing, "
-        "no people, no text, no products, no logos, no vignette, no frame"
+        "forested mountain slopes, rocky paths, misty atmosphere, soft morning light, photorealistic"
     ),
 }
 
+# Full regional background prompts
+REGION_PROMPTS = {
+    region: f"{scene}, {_PROMPT_TAIL}" for region, scene in _REGION_SCENES.items()
+}
 
-def generate_background(region: str, size: str = "1792x1024") -> Image.Image:
-    """
-    Generate a regional background image using DALL-E 3.
+# Region keys are fixed at import time, so share one immutable sequence
+_REGIONS = tuple(REGION_PROMPTS)
+_FALLBACK_REGION = _REGIONS[0]
 
-    Args:
-        region: Region key (pacific_northwest, southwest, northeast, rockies)
-        size: Image size (1792x1024 for landscape, 1024x1792 for portrait)
 
-    Returns:
-        PIL Image of the generated background
-    """
-    # Get prompt for region, fallback to first available region if not found
-    prompt = REGION_PROMPTS.get(region)
-    if prompt is None:
-        # Use first available region as fallback
-        fallback_region = list(REGION_PROMPTS.keys())[0]
-        print(
-            f"Warning: Region '{region}' not found. Using '{fallback_region}' as fallback."
-        )
-        prompt = REGION_PROMPTS[fallback_region]
+def _resolve_region(region: str) -> str:
+    """Map a region to a known key, falling back to the first region if unknown."""
+    if region in REGION_PROMPTS:
+        return region
+    print(
+        f"Warning: Region '{region}' not found. Using '{_FALLBACK_REGION}' as fallback."
+    )
+    return _FALLBACK_REGION
+
+
+def get_region_prompt(region: str) -> str:
+    """Get the prompt for a region, falling back to the first region if unknown."""
+    return REGION_PROMPTS[_resolve_region(region)]
+
+
+async def _gen_bg_async(
+    region: str, size: str, client: AsyncOpenAI, http: httpx.AsyncClient
+) -> Image.Image:
+    """Generate and download a single background without blocking the event loop."""
+    prompt = get_region_prompt(region)
 
     print(f"Generating {region} background...")
 
-    client = get_openai_client()
-    response = client.images.generate(
+    response = await client.images.generate(
         model="dall-e-3",
         prompt=prompt,
         size=size,
@@ -126,15 +173,133 @@ def generate_background(region: str, size: str = "1792x1024") -> Image.Image:
         n=1,
     )
 
-    # Download the image
+    # Download and decode the image; DALL-E returns PNG, which Pillow can't
+    # decode incrementally, so read the whole body then decode it in one pass
     image_url = response.data[0].url
-    image_response = requests.get(image_url)
+    image_response = await http.get(image_url)
+    image_response.raise_for_status()
     image = Image.open(BytesIO(image_response.content))
+    image.load()
 
     print(f"Background generated successfully!")
     return image
 
 
-def get_available_regions() -> list[str]:
-    """Return list of available region keys."""
-    return list(REGION_PROMPTS.keys())
+async def _generate_backgrounds_async(
+    regions: list[str], size: str
+) -> list[Image.Image]:
+    """Run all background generations concurrently on shared clients."""
+    client = get_async_openai_client()
+    http = _get_download_client()
+    return await asyncio.gather(
+        *(_gen_bg_async(region, size, client, http) for region in regions)
+    )
+
+
+def _background_cache_path(region: str, size: str) -> Path:
+    """
+    Cache file for a region + size; the prompt hash invalidates edited prompts.
+
+    region must already be a known key (see _resolve_region), so untrusted
+    input never reaches the filename.
+    """
+    prompt = REGION_PROMPTS[region]
+    digest = hashlib.sha1(prompt.encode()).hexdigest()[:8]
+    return BACKGROUND_CACHE_DIR / f"{region}_{size}_{digest}.png"
+
+
+@functools.lru_cache(maxsize=64)
+def _load_cached_background(path: Path, mtime_ns: int) -> Image.Image:
+    """
+    Decode a cached background once per file version; callers must not mutate it.
+
+    mtime_ns is part of the cache key so a regenerated or replaced file is re-read.
+    """
+    image = Image.open(path)
+    image.load()
+    return image
+
+
+def _save_cached_background(path: Path, image: Image.Image) -> None:
+    """Write a background to the disk cache atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique temp name per writer, so concurrent runs never share a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".png")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            image.save(f, "PNG")
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def generate_backgrounds_bulk(
+    regions: list[str], size: str = "1792x1024"
+) -> list[Image.Image]:
+    """
+    Generate several regional backgrounds concurrently using DALL-E 3.
+
+    Backgrounds are cached per region + size, in process and on disk, so each
+    distinct region is only generated once. Any that are missing are requested
+    concurrently, so wall-clock time is roughly that of the slowest single
+    generation rather than the sum of all of them.
+
+    Args:
+        regions: Region keys, one per background to return (may repeat)
+        size: Image size (1792x1024 for landscape, 1024x1792 for portrait)
+
+    Returns:
+        PIL Images of the backgrounds, in the same order as regions. Images may
+        be shared between calls, so treat them as read-only.
+    """
+    # Resolve unknown regions to the fallback first, so misspellings share its
+    # cache entry and generation rather than each costing a separate call
+    resolved = {region: _resolve_region(region) for region in dict.fromkeys(regions)}
+    backgrounds = {}
+    missing = []
+    for region in dict.fromkeys(resolved.values()):
+        cache_path = _background_cache_path(region, size)
+        try:
+            mtime_ns = cache_path.stat().st_mtime_ns
+            backgrounds[region] = _load_cached_background(cache_path, mtime_ns)
+        except FileNotFoundError:
+            missing.append(region)
+            continue
+        except OSError:
+            # Truncated or corrupt file (UnidentifiedImageError is an OSError);
+            # drop it and regenerate
+            print(f"Warning: Discarding unreadable cached {region} background")
+            cache_path.unlink(missing_ok=True)
+            missing.append(region)
+            continue
+        print(f"Using cached {region} background")
+
+    if missing:
+        generated = asyncio.run_coroutine_threadsafe(
+            _generate_backgrounds_async(missing, size), _get_event_loop()
+        ).result()
+        for region, image in zip(missing, generated):
+            _save_cached_background(_background_cache_path(region, size), image)
+            backgrounds[region] = image
+
+    return [backgrounds[resolved[region]] for region in regions]
+
+
+def generate_background(region: str, size: str = "1792x1024") -> Image.Image:
+    """
+    Generate a regional background image using DALL-E 3.
+
+    Args:
+        region: Region key (pacific_northwest, southwest, northeast, rockies)
+        size: Image size (1792x1024 for landscape, 1024x1792 for portrait)
+
+    Returns:
+        PIL Image of the generated background
+    """
+    return generate_backgrounds_bulk([region], size)[0]
+
+
+def get_available_regions() -> tuple[str, ...]:
+    """Return available region keys."""
+    return _REGIONS
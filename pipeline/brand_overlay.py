@@ -3,21 +3,55 @@ Brand overlay - adds campaign text and logo to images.
 """
 
 import os
+import json
+import functools
+from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 from typing import Tuple, Optional
 from .models import BrandConfig
+from .compositor import downscale_rgba
+from .layout import LayoutSolver
 
+# Resolved font paths are persisted so later runs skip the filesystem search
+FONT_PATH_CACHE = Path.home() / ".cache" / "adobe-creative-project" / "font_paths.json"
 
-def get_font(font_name: str, size: int) -> ImageFont.FreeTypeFont:
-    """
-    Load a font, falling back to default if not found.
 
-    Args:
-        font_name: Name of the font (e.g., "Oswald-Bold")
-        size: Font size in pixels
+def _read_font_path_cache() -> dict[str, str]:
+    """Load persisted font name -> path resolutions, if any."""
+    try:
+        with open(FONT_PATH_CACHE, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
-    Returns:
-        PIL ImageFont object
+
+def _write_font_path_cache(cache: dict[str, str]) -> None:
+    """Persist font resolutions; failures only cost a search next run."""
+    try:
+        FONT_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = FONT_PATH_CACHE.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, FONT_PATH_CACHE)
+    except OSError:
+        pass
+
+
+def _is_loadable_font(path: str) -> bool:
+    """Check that FreeType can open a font file."""
+    try:
+        ImageFont.truetype(path)
+        return True
+    except:
+        return False
+
+
+def _search_font_path(font_name: str) -> Tuple[Optional[str], bool]:
+    """
+    Search the filesystem for a usable font file for font_name.
+
+    Returns the path (None if nothing loads) and whether it is the requested
+    font itself rather than a fallback.
     """
     # Common font paths to check
     font_paths = [
@@ -45,126 +79,210 @@ def get_font(font_name: str, size: int) -> ImageFont.FreeTypeFont:
         "Oswald",
     ]
 
-    for font_var in font_variations:
+    for i, font_var in enumerate(font_variations):
         for path_template in font_paths:
             path = os.path.expanduser(path_template.replace(font_name, font_var))
-            if os.path.exists(path):
-                try:
-                    return ImageFont.truetype(path, size)
-                except:
-                    continue
+            if os.path.exists(path) and _is_loadable_font(path):
+                # The first two variations are spellings of the requested font
+                return path, i < 2
 
     # Try system font collection files (Mac)
-    try:
-        return ImageFont.truetype("/System/Library/Fonts/Supplemental/Impact.ttf", size)
-    except:
-        pass
+    for path in [
+        "/System/Library/Fonts/Supplemental/Impact.ttf",
+        "/System/Library/Fonts/Helvetica.ttc",
+    ]:
+        if _is_loadable_font(path):
+            return path, False
 
-    try:
-        return ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", size)
-    except:
-        pass
+    return None, False
 
-    return ImageFont.load_default()
 
+@functools.lru_cache(maxsize=64)
+def _resolve_font_path(font_name: str) -> Optional[str]:
+    """
+    Resolve a font name to a file path once per process (None = default font).
 
-def wrap_text(
-    text: str, font: ImageFont.FreeTypeFont, max_width: int, draw: ImageDraw.Draw
-) -> list[str]:
+    Only exact matches are persisted; fallbacks are searched again each run so
+    a brand font installed later is picked up.
     """
-    Wrap text to fit within a maximum width.
+    persisted = _read_font_path_cache()
+    path = persisted.get(font_name)
+    # Only trust entries that are the font itself (older caches held fallbacks)
+    exact_stems = (font_name, font_name.replace("-", " "))
+    if path and Path(path).stem in exact_stems and os.path.exists(path):
+        return path
+
+    path, exact = _search_font_path(font_name)
+    if exact:
+        persisted[font_name] = path
+        _write_font_path_cache(persisted)
+    elif font_name in persisted:
+        # Drop a stale or fallback entry so it is not consulted again
+        del persisted[font_name]
+        _write_font_path_cache(persisted)
+    return path
+
+
+@functools.lru_cache(maxsize=64)
+def _load_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Parse a font file at a given size once per process."""
+    return ImageFont.truetype(path, size)
+
+
+def get_font(font_name: str, size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load a font, falling back to default if not found.
+
+    Path resolution and font loading are cached, so repeated calls are dict
+    lookups. The returned font may be shared between callers.
 
     Args:
-        text: Text to wrap
+        font_name: Name of the font (e.g., "Oswald-Bold")
+        size: Font size in pixels
+
+    Returns:
+        PIL ImageFont object
+    """
+    path = _resolve_font_path(font_name)
+    if path is None:
+        return ImageFont.load_default()
+    return _load_font(path, size)
+
+
+# Text width memo keyed by (text, (font path, size)); cleared per campaign
+_line_width_cache: dict[tuple[str, tuple], float] = {}
+
+
+def _font_key(font: ImageFont.FreeTypeFont) -> Optional[tuple]:
+    """Stable cache key for a font loaded from a file, or None if uncacheable."""
+    path = getattr(font, "path", None)
+    if not isinstance(path, str):
+        return None
+    return (path, font.size)
+
+
+def _text_width(text: str, font: ImageFont.FreeTypeFont) -> float:
+    """
+    Measure the advance width of text, memoized per font.
+
+    Args:
+        text: Text to measure
         font: Font to use for measuring
-        max_width: Maximum width in pixels
-        draw: ImageDraw object for measuring text
 
     Returns:
-        List of lines
+        Width in pixels
     """
+    key = _font_key(font)
+    if key is None:
+        return font.getlength(text)
+
+    cache_key = (text, key)
+    width = _line_width_cache.get(cache_key)
+    if width is None:
+        width = _line_width_cache[cache_key] = font.getlength(text)
+    return width
+
+
+def _wrap_words(
+    text: str, font: ImageFont.FreeTypeFont, max_width: int
+) -> tuple[str, ...]:
+    """Greedily pack words into lines using running widths."""
     words = text.split()
+
+    # Most headlines fit on one line, so measure the whole text first
+    single_line = " ".join(words)
+    if words and _text_width(single_line, font) <= max_width:
+        return (single_line,)
+
+    widths = [_text_width(word, font) for word in words]
+    space_width = _text_width(" ", font)
     lines = []
     current_line = []
+    current_width = 0.0
 
-    for word in words:
+    for word, word_width in zip(words, widths):
         # Try adding this word to the current line
-        test_line = " ".join(current_line + [word])
-        bbox = draw.textbbox((0, 0), test_line, font=font)
-        test_width = bbox[2] - bbox[0]
+        test_width = (
+            current_width + space_width + word_width if current_line else word_width
+        )
 
         if test_width <= max_width:
             current_line.append(word)
+            current_width = test_width
         else:
             # Current line is full, start a new line
             if current_line:
                 lines.append(" ".join(current_line))
             current_line = [word]
+            current_width = word_width
 
     # Don't forget the last line
     if current_line:
         lines.append(" ".join(current_line))
 
-    return lines if lines else [text]
+    return tuple(lines) if lines else (text,)
 
 
-def add_text_with_background(
-    image: Image.Image,
-    text: str,
-    position: str,
-    font: ImageFont.FreeTypeFont,
-    text_color: str,
-    bg_color: str,
-    bg_opacity: float,
-    margin_percent: float,
-    max_width_percent: float = 70.0,
-) -> Image.Image:
+@functools.lru_cache(maxsize=256)
+def _wrap_cached(text: str, font_key: tuple, max_width: int) -> tuple[str, ...]:
+    """Wrap text for a file-backed font; the font itself is a cached load."""
+    return _wrap_words(text, _load_font(*font_key), max_width)
+
+
+def wrap_text(text: str, font: ImageFont.FreeTypeFont, max_width: int) -> list[str]:
     """
-    Add text with a semi-transparent background pill, wrapping to multiple lines if needed.
+    Wrap text to fit within a maximum width.
+
+    Each word is measured once and lines are packed greedily using running
+    widths. Results are memoized by (text, font, max_width), so a campaign
+    message is only wrapped once per font size.
 
     Args:
-        image: Image to draw on
-        text: Text to display
-        position: Position ("top-left", "top-center", "bottom-left", etc.)
-        font: PIL ImageFont object
-        text_color: Hex color for text
-        bg_color: Hex color for background
-        bg_opacity: Background opacity (0-1)
-        margin_percent: Margin from edges as percentage of image size
-        max_width_percent: Maximum width of text box as percentage of image width
+        text: Text to wrap
+        font: Font to use for measuring
+        max_width: Maximum width in pixels
 
     Returns:
-        Image with text overlay
+        List of lines
     """
-    result = image.copy().convert("RGBA")
+    key = _font_key(font)
+    if key is None:
+        return list(_wrap_words(text, font, max_width))
+    return list(_wrap_cached(text, key, max_width))
 
-    # Create overlay for semi-transparent background
-    overlay = Image.new("RGBA", result.size, (0, 0, 0, 0))
-    draw = ImageDraw.Draw(overlay)
 
-    # Calculate maximum allowed width for text
-    margin_x = int(result.width * margin_percent / 100)
-    margin_y = int(result.height * margin_percent / 100)
-    max_text_width = int(result.width * max_width_percent / 100)
+def clear_text_caches() -> None:
+    """Drop memoized wrap, width and sprite results to bound memory between campaigns."""
+    _wrap_cached.cache_clear()
+    _render_text_sprite.cache_clear()
+    _line_width_cache.clear()
+
 
+def _as_rgba(image: Image.Image, copy: bool) -> Image.Image:
+    """Return an RGBA image to draw on, copying only when asked to."""
+    if image.mode != "RGBA":
+        return image.convert("RGBA")
+    return image.copy() if copy else image
+
+
+def _build_text_sprite(
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    text_rgb: Tuple[int, int, int],
+    bg_rgba: Tuple[int, int, int, int],
+    max_text_width: int,
+) -> Image.Image:
+    """Render wrapped text on its background pill, sized to the pill."""
     # Wrap text to multiple lines if needed
-    lines = wrap_text(text, font, max_text_width, draw)
+    lines = wrap_text(text, font, max_text_width)
 
     # Calculate dimensions for each line and find the widest
-    line_heights = []
-    line_widths = []
-    for line in lines:
-        # Get the actual rendered size using textlength for width
-        line_width = draw.textlength(line, font=font)
-        line_widths.append(int(line_width))
-        # For height, use a sample character to get consistent line height
-        bbox = draw.textbbox(
-            (0, 0), "Ag", font=font
-        )  # Use chars with ascender/descender
-        line_heights.append(bbox[3] - bbox[1])
+    line_widths = [int(_text_width(line, font)) for line in lines]
+    # For height, use chars with ascender/descender to get consistent line height
+    bbox = font.getbbox("Ag")
+    line_height = bbox[3] - bbox[1]
 
     max_line_width = max(line_widths)
-    line_height = max(line_heights) if line_heights else 50
     line_spacing = int(line_height * 0.2)  # 20% spacing between lines
     total_text_height = (line_height * len(lines)) + (line_spacing * (len(lines) - 1))
 
@@ -176,68 +294,190 @@ def add_text_with_background(
     total_box_width = max_line_width + padding_x * 2
     total_box_height = total_text_height + padding_y * 2
 
-    # Calculate position
-    if "left" in position:
-        x = margin_x
-    elif "right" in position:
-        x = result.width - total_box_width - margin_x
-    else:  # center
-        x = (result.width - total_box_width) // 2
-
-    # Ensure x stays within bounds
-    x = max(margin_x, min(x, result.width - total_box_width - margin_x))
-
-    if "top" in position:
-        y = margin_y
-    elif "bottom" in position:
-        y = result.height - total_box_height - margin_y
-    else:  # center
-        y = (result.height - total_box_height) // 2
-
-    # Draw background pill
-    bg_rgb = tuple(int(bg_color.lstrip("#")[i : i + 2], 16) for i in (0, 2, 4))
-    bg_rgba = (*bg_rgb, int(255 * bg_opacity))
-
-    pill_bbox = [x, y, x + total_box_width, y + total_box_height]
-
-    # Draw rounded rectangle
+    # Draw rounded rectangle filling the sprite
+    sprite = Image.new("RGBA", (total_box_width, total_box_height))
+    draw = ImageDraw.Draw(sprite)
     radius = int(line_height * 0.25)
-    draw.rounded_rectangle(pill_bbox, radius=radius, fill=bg_rgba)
-
-    # Composite overlay
-    result = Image.alpha_composite(result, overlay)
-
-    # Draw each line of text
-    draw = ImageDraw.Draw(result)
-    text_rgb = tuple(int(text_color.lstrip("#")[i : i + 2], 16) for i in (0, 2, 4))
+    draw.rounded_rectangle(
+        [0, 0, total_box_width - 1, total_box_height - 1], radius=radius, fill=bg_rgba
+    )
 
     # Calculate starting y position - center text vertically in the pill
     # Get the bounding box of the first line to find where to start
     first_line_bbox = draw.textbbox((0, 0), lines[0], font=font)
     first_line_height = first_line_bbox[3] - first_line_bbox[1]
 
-    # Start y position: top of box + padding + (line_height - first_line_height) / 2
+    # Start y position: padding + (line_height - first_line_height) / 2
     # This centers the first line's bounding box within its allocated space
-    current_y = y + padding_y + (line_height - first_line_height) // 2
+    current_y = padding_y + (line_height - first_line_height) // 2
 
-    for i, line in enumerate(lines):
+    # Draw each line of text
+    for line in lines:
         # Center each line within the box
         line_bbox = draw.textbbox((0, 0), line, font=font)
         line_width = line_bbox[2] - line_bbox[0]
-        line_x = x + padding_x + (max_line_width - line_width) // 2  # Center align
+        line_x = padding_x + (max_line_width - line_width) // 2  # Center align
 
         draw.text((line_x, current_y), line, font=font, fill=(*text_rgb, 255))
         current_y += line_height + line_spacing
 
+    return sprite
+
+
+@functools.lru_cache(maxsize=32)
+def _render_text_sprite(
+    text: str,
+    font_key: tuple,
+    text_rgb: Tuple[int, int, int],
+    bg_rgba: Tuple[int, int, int, int],
+    max_text_width: int,
+) -> Image.Image:
+    """Cached text sprite for a file-backed font; the result must not be drawn on."""
+    return _build_text_sprite(
+        text, _load_font(*font_key), text_rgb, bg_rgba, max_text_width
+    )
+
+
+# A positioned overlay element: (RGBA sprite, (x, y) top-left on the canvas)
+Layer = Tuple[Image.Image, Tuple[int, int]]
+
+
+def _composite_layers(image: Image.Image, layers: list[Layer]) -> None:
+    """
+    Alpha-composite layers onto an RGBA image in place, in order.
+
+    Each layer only touches its own footprint; layers hanging off the
+    top/left edge are clipped via the source offset.
+    """
+    for sprite, (x, y) in layers:
+        image.alpha_composite(
+            sprite, dest=(max(x, 0), max(y, 0)), source=(max(-x, 0), max(-y, 0))
+        )
+
+
+def _text_layer(
+    layout: LayoutSolver,
+    text: str,
+    position: str,
+    font: ImageFont.FreeTypeFont,
+    text_rgb: Tuple[int, int, int],
+    bg_rgb: Tuple[int, int, int],
+    bg_opacity: float,
+    max_width_percent: float,
+) -> Layer:
+    """Text pill sprite and its position for the solver's image."""
+    # Calculate maximum allowed width for text
+    max_text_width = int(layout.width * max_width_percent / 100)
+
+    bg_rgba = (*bg_rgb, int(255 * bg_opacity))
+    key = _font_key(font)
+    if key is None:
+        sprite = _build_text_sprite(text, font, text_rgb, bg_rgba, max_text_width)
+    else:
+        sprite = _render_text_sprite(
+            text, key, tuple(text_rgb), bg_rgba, max_text_width
+        )
+
+    return sprite, layout.place(*sprite.size, position)
+
+
+def add_text_with_background(
+    image: Image.Image,
+    text: str,
+    position: str,
+    font: ImageFont.FreeTypeFont,
+    text_rgb: Tuple[int, int, int],
+    bg_rgb: Tuple[int, int, int],
+    bg_opacity: float,
+    margin_percent: float,
+    max_width_percent: float = 70.0,
+    _copy: bool = True,
+) -> Image.Image:
+    """
+    Add text with a semi-transparent background pill, wrapping to multiple lines if needed.
+
+    The text and pill are rendered once per (text, font, colors, width) as a
+    cached sprite and then composited at the requested position.
+
+    Args:
+        image: Image to draw on
+        text: Text to display
+        position: Position ("top-left", "top-center", "bottom-left", etc.)
+        font: PIL ImageFont object
+        text_rgb: RGB color for text
+        bg_rgb: RGB color for background
+        bg_opacity: Background opacity (0-1)
+        margin_percent: Margin from edges as percentage of image size
+        max_width_percent: Maximum width of text box as percentage of image width
+        _copy: Copy an RGBA input before drawing; pass False to draw in place
+
+    Returns:
+        Image with text overlay
+    """
+    result = _as_rgba(image, _copy)
+    layer = _text_layer(
+        LayoutSolver(result.width, result.height, margin_percent),
+        text,
+        position,
+        font,
+        text_rgb,
+        bg_rgb,
+        bg_opacity,
+        max_width_percent,
+    )
+    _composite_layers(result, [layer])
+
     return result
 
 
+@functools.lru_cache(maxsize=32)
+def _decode_scaled_asset(path: str, mtime_ns: int, max_width: int) -> Image.Image:
+    """
+    Decode an asset as RGBA and scale it down to max_width, once per file version.
+
+    mtime_ns is part of the cache key so a replaced file is re-read.
+    """
+    with Image.open(path) as img:
+        img.load()
+        asset = img.convert("RGBA")
+    if asset.width > max_width:
+        scale = max_width / asset.width
+        new_height = int(asset.height * scale)
+        asset = downscale_rgba(asset, (max_width, new_height))
+    return asset
+
+
+def _load_scaled_asset(path: str, max_width: int) -> Image.Image:
+    """
+    Load an RGBA asset scaled down to max_width, caching the result.
+
+    The returned image is shared between callers and must only be
+    composited, never drawn on.
+    """
+    return _decode_scaled_asset(path, os.stat(path).st_mtime_ns, max_width)
+
+
+def _logo_layer(
+    layout: LayoutSolver,
+    logo_path: str,
+    position: str,
+    max_width_percent: float,
+) -> Layer:
+    """Scaled logo sprite and its position for the solver's image."""
+    # Load logo scaled to the max width (cached per size)
+    max_width = int(layout.width * max_width_percent / 100)
+    logo = _load_scaled_asset(logo_path, max_width)
+
+    return logo, layout.place(*logo.size, position)
+
+
 def add_logo(
     image: Image.Image,
     logo_path: str,
     position: str,
     max_width_percent: float,
     margin_percent: float,
+    _copy: bool = True,
 ) -> Image.Image:
     """
     Add logo to image at specified position.
@@ -248,40 +488,58 @@ def add_logo(
         position: Position ("bottom-right", "bottom-left", "top-right", "top-left")
         max_width_percent: Maximum logo width as percentage of image width
         margin_percent: Margin from edges as percentage
+        _copy: Copy an RGBA input before drawing; pass False to draw in place
 
     Returns:
         Image with logo overlay
     """
-    result = image.copy().convert("RGBA")
+    result = _as_rgba(image, _copy)
+    layer = _logo_layer(
+        LayoutSolver(result.width, result.height, margin_percent),
+        logo_path,
+        position,
+        max_width_percent,
+    )
+    _composite_layers(result, [layer])
 
-    # Load logo
-    logo = Image.open(logo_path).convert("RGBA")
+    return result
 
-    # Scale logo
-    max_width = int(result.width * max_width_percent / 100)
-    if logo.width > max_width:
-        scale = max_width / logo.width
-        new_height = int(logo.height * scale)
-        logo = logo.resize((max_width, new_height), Image.Resampling.LANCZOS)
 
-    # Calculate position
-    margin_x = int(result.width * margin_percent / 100)
-    margin_y = int(result.height * margin_percent / 100)
+def _cta_layer(
+    image_size: Tuple[int, int],
+    button_image_path: str,
+    max_width_percent: float,
+    spacing_below_product: float,
+) -> Optional[Layer]:
+    """Scaled CTA button sprite and its position, or None if the image is missing."""
+    width, height = image_size
 
-    if "left" in position:
-        x = margin_x
-    else:  # right
-        x = result.width - logo.width - margin_x
+    # Load button image
+    if not os.path.exists(button_image_path):
+        print(
+            f"Warning: Button image not found at {button_image_path}, skipping button"
+        )
+        return None
 
-    if "top" in position:
-        y = margin_y
-    else:  # bottom
-        y = result.height - logo.height - margin_y
+    # Scale button to fit within max width while maintaining aspect ratio
+    max_width = int(width * max_width_percent / 100)
+    button = _load_scaled_asset(button_image_path, max_width)
 
-    # Paste logo
-    result.paste(logo, (x, y), logo)
+    # Position - centered horizontally, directly below centered product
+    # Products are centered vertically, so calculate where product bottom would be
+    # For centered products with typical heights (40-65% of image), bottom is around 70-82% from top
+    # Use 70% as a good estimate for most cases, then add spacing
+    product_bottom_estimate = int(height * 0.70)  # Estimate where product bottom is
+    spacing = int(height * spacing_below_product)
+    y = product_bottom_estimate + spacing
+    x = (width - button.width) // 2
 
-    return result
+    # Make sure button doesn't go off bottom of image (leave 5% margin)
+    max_y = height - int(height * 0.05) - button.height
+    if y > max_y:
+        y = max_y
+
+    return button, (x, y)
 
 
 def add_cta_button(
@@ -289,6 +547,7 @@ def add_cta_button(
     button_image_path: str,
     max_width_percent: float = 45.0,
     spacing_below_product: float = 0.03,
+    _copy: bool = True,
 ) -> Image.Image:
     """
     Add a call-to-action button directly below the product (centered horizontally).
@@ -298,46 +557,17 @@ def add_cta_button(
         button_image_path: Path to button PNG image
         max_width_percent: Maximum button width as percentage of image width
         spacing_below_product: Spacing below product as percentage of image height
+        _copy: Copy an RGBA input before drawing; pass False to draw in place
 
     Returns:
         Image with CTA button added
     """
-    result = image.copy().convert("RGBA")
-
-    # Load button image
-    if not os.path.exists(button_image_path):
-        print(
-            f"Warning: Button image not found at {button_image_path}, skipping button"
-        )
-        return result
-
-    button = Image.open(button_image_path).convert("RGBA")
-
-    # Scale button to fit within max width while maintaining aspect ratio
-    max_width = int(result.width * max_width_percent / 100)
-    if button.width > max_width:
-        scale = max_width / button.width
-        new_height = int(button.height * scale)
-        button = button.resize((max_width, new_height), Image.Resampling.LANCZOS)
-
-    # Position - centered horizontally, directly below centered product
-    # Products are centered vertically, so calculate where product bottom would be
-    # For centered products with typical heights (40-65% of image), bottom is around 70-82% from top
-    # Use 70% as a good estimate for most cases, then add spacing
-    product_bottom_estimate = int(
-        result.height * 0.70
-    )  # Estimate where product bottom is
-    spacing = int(result.height * spacing_below_product)
-    y = product_bottom_estimate + spacing
-    x = (result.width - button.width) // 2
-
-    # Make sure button doesn't go off bottom of image (leave 5% margin)
-    max_y = result.height - int(result.height * 0.05) - button.height
-    if y > max_y:
-        y = max_y
-
-    # Paste button
-    result.paste(button, (x, y), button)
+    result = _as_rgba(image, _copy)
+    layer = _cta_layer(
+        result.size, button_image_path, max_width_percent, spacing_below_product
+    )
+    if layer is not None:
+        _composite_layers(result, [layer])
 
     return result
 
@@ -362,15 +592,20 @@ def apply_brand_overlay(
     campaign_message: str,
     brand_config: BrandConfig,
     aspect_ratio: str = "1x1",
+    _copy: bool = True,
 ) -> Image.Image:
     """
     Apply complete brand overlay (text + logo + CTA button) to an image.
 
+    Each element is resolved to a cached sprite and position first, then all
+    are composited onto the image in one pass over their footprints.
+
     Args:
         image: Base image
         campaign_message: Campaign message text
         brand_config: Brand configuration
         aspect_ratio: Aspect ratio name (1x1, 9x16, 16x9) for size-specific rules
+        _copy: Copy an RGBA input before drawing; pass False to draw in place
 
     Returns:
         Image with brand overlay applied
@@ -381,38 +616,50 @@ def apply_brand_overlay(
     font_size = int(min(image.width, image.height) * 0.065)
     font = get_font(brand_config.typography.get("headline_font", "Arial"), font_size)
 
-    # Add text
-    result = add_text_with_background(
-        image=image,
-        text=campaign_message.upper(),  # Outdoor brands often use uppercase
-        position=layout.text_position,
-        font=font,
-        text_color=brand_config.colors.get("text_light", "#FFFFFF"),
-        bg_color=brand_config.colors.get("secondary", "#000000"),
-        bg_opacity=layout.text_background_opacity,
-        margin_percent=layout.safe_margin_percent,
-    )
+    # Margins and position math are shared by the text and logo
+    layout_solver = LayoutSolver(image.width, image.height, layout.safe_margin_percent)
+
+    # Collect every element as a positioned sprite, bottom to top
+    layers = [
+        _text_layer(
+            layout_solver,
+            text=campaign_message.upper(),  # Outdoor brands often use uppercase
+            position=layout.text_anchor,
+            font=font,
+            text_rgb=brand_config.text_rgb,
+            bg_rgb=brand_config.bg_rgb,
+            bg_opacity=layout.text_background_opacity,
+            max_width_percent=70.0,
+        )
+    ]
 
-    # Add CTA button (below product) with aspect-ratio-specific size
+    # CTA button (below product) with aspect-ratio-specific size
     button_path = "assets/cta-button.png"  # Path to your button PNG
     button_size = CTA_BUTTON_SIZES.get(aspect_ratio, 45.0)
-    result = add_cta_button(
-        image=result,
+    button_layer = _cta_layer(
+        image.size,
         button_image_path=button_path,
         max_width_percent=button_size,
         spacing_below_product=0.03,
     )
+    if button_layer is not None:
+        layers.append(button_layer)
 
-    # Add logo with aspect-ratio-specific size
+    # Logo with aspect-ratio-specific size
     logo_path = brand_config.logos.get("primary")
     if logo_path and os.path.exists(logo_path):
         logo_size = LOGO_SIZES.get(aspect_ratio, layout.logo_max_width_percent)
-        result = add_logo(
-            image=result,
-            logo_path=logo_path,
-            position=layout.logo_position,
-            max_width_percent=logo_size,
-            margin_percent=layout.safe_margin_percent,
+        layers.append(
+            _logo_layer(
+                layout_solver,
+                logo_path=logo_path,
+                position=layout.logo_anchor,
+                max_width_percent=logo_size,
+            )
         )
 
+    # Convert (or copy) once, then composite all layers in a single pass
+    result = _as_rgba(image, _copy)
+    _composite_layers(result, layers)
+
     return result
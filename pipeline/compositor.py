@@ -5,32 +5,60 @@ Product compositing - places product PNGs onto backgrounds.
 from PIL import Image
 
 
+def downscale_rgba(
+    image: Image.Image, size: tuple[int, int], reducing_gap: float = 2.0
+) -> Image.Image:
+    """
+    LANCZOS-resize an RGBA image, box-reducing heavy downscales first.
+
+    Image.resize ignores reducing_gap for RGBA images (it resamples in
+    premultiplied RGBa), so the cheap integer reduction is done here.
+
+    Args:
+        image: RGBA image to shrink
+        size: Target (width, height)
+        reducing_gap: Minimum scale left over for the LANCZOS pass
+
+    Returns:
+        Resized RGBA image
+    """
+    factor = int(min(image.width / size[0], image.height / size[1]) / reducing_gap)
+    if factor < 2:
+        return image.resize(size, Image.Resampling.LANCZOS)
+
+    premultiplied = image.convert("RGBa").reduce(factor)
+    return premultiplied.resize(size, Image.Resampling.LANCZOS).convert("RGBA")
+
+
 def composite_product_on_background(
     background: Image.Image,
     product: Image.Image,
     position: str = "center",
     product_scale: float = 0.5,
     max_height_percent: float = 0.50,
+    _copy: bool = True,
 ) -> Image.Image:
     """
     Composite a product image onto a background.
 
     Args:
         background: Background image
-        product: Product image with transparent background (shadows should be baked into the PNG)
+        product: Loaded RGBA product image with transparent background (shadows should be baked into the PNG)
         position: Where to place product ("center-bottom", "center", "left", "right")
         product_scale: Scale factor for product relative to background width
         max_height_percent: Maximum height as percentage of background (prevents tall products from dominating)
+        _copy: Copy an RGBA background before drawing; pass False to draw in place
 
     Returns:
         Composited image
     """
-    # Work on a copy
-    result = background.copy().convert("RGBA")
-
-    # Ensure product has alpha
-    if product.mode != "RGBA":
-        product = product.convert("RGBA")
+    # Work on a copy (convert already returns a new image)
+    if background.mode != "RGBA":
+        result = background.convert("RGBA")
+    elif _copy:
+        result = background.copy()
+    else:
+        result = background
 
     # Calculate scale based on width
     target_width = int(result.width * product_scale)
@@ -45,9 +73,13 @@ def composite_product_on_background(
         target_height = max_height
         target_width = int(product.width * scale_ratio)
 
-    product_scaled = product.resize(
-        (target_width, target_height), Image.Resampling.LANCZOS
-    )
+    # Heavy downscales get a cheap integer reduction before the LANCZOS pass
+    if scale_ratio <= 0.5:
+        product_scaled = downscale_rgba(product, (target_width, target_height))
+    else:
+        product_scaled = product.resize(
+            (target_width, target_height), Image.Resampling.LANCZOS
+        )
 
     # Calculate position
     if position == "center-bottom":
@@ -68,7 +100,9 @@ def composite_product_on_background(
         x = (result.width - product_scaled.width) // 2
         y = (result.height - product_scaled.height) // 2
 
-    # Paste product (shadow is already baked into the PNG)
+    # Paste product (shadow is already baked into the PNG). Pillow's masked
+    # paste is a single C pass over the product's footprint; a NumPy "over"
+    # blend of the same region measured several times slower
     result.paste(product_scaled, (x, y), product_scaled)
 
     return result
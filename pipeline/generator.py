@@ -4,16 +4,18 @@ Main pipeline orchestrator - ties all components together.
 
 import os
 import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from PIL import Image
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from datetime import datetime
 
-from .models import CampaignBrief, BrandConfig
-from .background_generator import generate_background
+from .models import CampaignBrief, BrandConfig, Product
+from .background_generator import generate_backgrounds_bulk
 from .compositor import composite_product_on_background
-from .aspect_ratios import resize_and_crop, ASPECT_RATIOS
-from .brand_overlay import apply_brand_overlay
+from .aspect_ratios import generate_all_aspect_ratios, ASPECT_RATIOS
+from .brand_overlay import apply_brand_overlay, clear_text_caches
 
 
 # Product scale and position settings per aspect ratio
@@ -29,6 +31,14 @@ PRODUCT_SETTINGS = {
     "16x9": {"scale": 0.50, "max_height": 0.65, "position": "center"},
 }
 
+# Pillow format and save options per output format
+# PNG uses fast deflate: encoding dominates per-creative cost at default level 6
+OUTPUT_FORMATS = {
+    "png": ("PNG", {"compress_level": 1}),
+    "jpeg": ("JPEG", {"quality": 90}),
+    "webp": ("WEBP", {"quality": 90, "method": 4}),
+}
+
 
 def load_campaign_brief(brief_path: str) -> CampaignBrief:
     """Load and validate a campaign brief from JSON."""
@@ -44,11 +54,122 @@ def load_brand_config(config_path: str) -> BrandConfig:
     return BrandConfig(**data)
 
 
+def _render_ratio(
+    ratio_name: str,
+    background: Image.Image,
+    product_image: Image.Image,
+    brief: CampaignBrief,
+    brand_config: BrandConfig,
+    product_dir: Path,
+    output_format: str = "png",
+) -> Tuple[str, str]:
+    """
+    Composite, overlay and save one aspect ratio of a product creative.
+
+    Args:
+        ratio_name: Aspect ratio name (1x1, 9x16, 16x9)
+        background: Background already cropped to this aspect ratio (shared, read-only)
+        product_image: Loaded product image (shared, read-only)
+        brief: Campaign brief (for the campaign message)
+        brand_config: Brand configuration
+        product_dir: Product output directory
+        output_format: Output format ("png", "jpeg" or "webp")
+
+    Returns:
+        Tuple of (aspect ratio name, generated file path)
+    """
+    # Get the appropriate product settings for this aspect ratio
+    settings = PRODUCT_SETTINGS.get(
+        ratio_name,
+        {"scale": 0.40, "max_height": 0.50, "position": "center"},
+    )
+
+    # Composite product onto the cropped background (copied, since crops are
+    # shared between products)
+    composited = composite_product_on_background(
+        background=background,
+        product=product_image,
+        position=settings["position"],
+        product_scale=settings["scale"],
+        max_height_percent=settings["max_height"],
+    )
+
+    # Apply brand overlay
+    final_image = apply_brand_overlay(
+        image=composited,
+        campaign_message=brief.campaign_message,
+        brand_config=brand_config,
+        aspect_ratio=ratio_name,
+        _copy=False,
+    )
+
+    # Save (single RGBA -> RGB flatten)
+    pil_format, save_options = OUTPUT_FORMATS[output_format]
+    output_path = product_dir / f"{ratio_name}.{output_format}"
+    final_image.convert("RGB").save(output_path, pil_format, **save_options)
+    return ratio_name, str(output_path)
+
+
+def _render_product(
+    product: Product,
+    cropped_backgrounds: Dict[str, Image.Image],
+    brief: CampaignBrief,
+    brand_config: BrandConfig,
+    campaign_dir: Path,
+    output_format: str = "png",
+) -> Tuple[str, List[str]]:
+    """
+    Render and save every aspect ratio for one product.
+
+    Top-level so it can be pickled into worker processes. The aspect ratios
+    are rendered on threads, since Pillow releases the GIL in its resize,
+    composite and encode loops.
+
+    Args:
+        product: Product to render
+        cropped_backgrounds: Background cropped to each aspect ratio (read-only)
+        brief: Campaign brief (for the campaign message)
+        brand_config: Brand configuration
+        campaign_dir: Campaign output directory
+        output_format: Output format ("png", "jpeg" or "webp")
+
+    Returns:
+        Tuple of (product ID, list of generated file paths)
+    """
+    product_dir = campaign_dir / product.id
+    product_dir.mkdir(exist_ok=True)
+
+    # Decode and convert the product once; render threads share it read-only
+    with Image.open(product.product_image) as img:
+        img.load()
+        product_image = img.convert("RGBA")
+
+    # Generate each aspect ratio with appropriate product scaling
+    with ThreadPoolExecutor(max_workers=len(ASPECT_RATIOS)) as executor:
+        rendered = list(
+            executor.map(
+                lambda ratio_name: _render_ratio(
+                    ratio_name,
+                    cropped_backgrounds[ratio_name],
+                    product_image,
+                    brief,
+                    brand_config,
+                    product_dir,
+                    output_format,
+                ),
+                ASPECT_RATIOS,
+            )
+        )
+
+    return product.id, [output_path for _, output_path in rendered]
+
+
 def generate_campaign_creatives(
     brief: CampaignBrief,
     brand_config: BrandConfig,
     output_dir: str = "output",
     progress_callback=None,
+    output_format: str = "png",
 ) -> Dict[str, List[str]]:
     """
     Generate all campaign creatives for all products and aspect ratios.
@@ -58,10 +179,17 @@ def generate_campaign_creatives(
         brand_config: Brand configuration
         output_dir: Output directory path
         progress_callback: Optional callback for progress updates (message, percent)
+        output_format: Output format ("png", "jpeg" or "webp")
 
     Returns:
         Dictionary mapping product IDs to lists of generated file paths
     """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unsupported output format {output_format!r}; "
+            f"expected one of {', '.join(OUTPUT_FORMATS)}"
+        )
+
     results = {}
 
     # Create output directory structure
@@ -70,9 +198,8 @@ def generate_campaign_creatives(
     campaign_dir = Path(output_dir) / f"{campaign_slug}_{region_slug}"
     campaign_dir.mkdir(parents=True, exist_ok=True)
 
-    total_steps = len(brief.products) * (
-        1 + len(ASPECT_RATIOS)
-    )  # bg gen + ratios per product
+    # bg gen (all products at once) + one step per rendered product
+    total_steps = 1 + len(brief.products)
     current_step = 0
 
     def update_progress(message: str):
@@ -81,58 +208,62 @@ def generate_campaign_creatives(
         if progress_callback:
             progress_callback(message, current_step / total_steps)
 
-    for product in brief.products:
-        product_results = []
-        product_dir = campaign_dir / product.id
-        product_dir.mkdir(exist_ok=True)
-
-        # Generate background for this product
-        update_progress(
-            f"Generating {brief.target_region} background for {product.name}..."
-        )
-        background = generate_background(brief.target_region)
-
-        # Load product image
-        product_image = Image.open(product.product_image)
-
-        # Generate each aspect ratio with appropriate product scaling
-        for ratio_name, ratio_config in ASPECT_RATIOS.items():
-            update_progress(f"Creating {ratio_name} for {product.name}...")
+    # One background per distinct region (cached on disk), shared by its products
+    update_progress(f"Generating {brief.target_region} background...")
+    backgrounds = generate_backgrounds_bulk([brief.target_region] * len(brief.products))
 
-            # First, crop background to target aspect ratio
-            cropped_bg = resize_and_crop(
-                background, ratio_config.width, ratio_config.height, focus="center"
+    # Crop each distinct background to every aspect ratio once; products that
+    # share a region share the same background object and so the same crops
+    crops_by_background = {}
+    for background in backgrounds:
+        if id(background) not in crops_by_background:
+            crops_by_background[id(background)] = generate_all_aspect_ratios(
+                background, focus="center"
             )
+    product_crops = [crops_by_background[id(background)] for background in backgrounds]
 
-            # Get the appropriate product settings for this aspect ratio
-            settings = PRODUCT_SETTINGS.get(
-                ratio_name,
-                {"scale": 0.40, "max_height": 0.50, "position": "center"},
+    # Render products in parallel worker processes; inline when only one worker
+    # would be used. Scripts calling this must guard with __name__ == "__main__".
+    max_workers = min(len(brief.products), os.cpu_count() or 1)
+    if max_workers <= 1:
+        for product, cropped_backgrounds in zip(brief.products, product_crops):
+            product_id, product_results = _render_product(
+                product,
+                cropped_backgrounds,
+                brief,
+                brand_config,
+                campaign_dir,
+                output_format,
             )
-
-            # Composite product onto the cropped background
-            composited = composite_product_on_background(
-                background=cropped_bg,
-                product=product_image,
-                position=settings["position"],
-                product_scale=settings["scale"],
-                max_height_percent=settings["max_height"],
-            )
-
-            # Apply brand overlay
-            final_image = apply_brand_overlay(
-                image=composited,
-                campaign_message=brief.campaign_message,
-                brand_config=brand_config,
-                aspect_ratio=ratio_name,
+            results[product_id] = product_results
+            update_progress(
+                f"Created {len(product_results)} creatives for {product.name}"
             )
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = {
+                executor.submit(
+                    _render_product,
+                    product,
+                    cropped_backgrounds,
+                    brief,
+                    brand_config,
+                    campaign_dir,
+                    output_format,
+                ): product
+                for product, cropped_backgrounds in zip(brief.products, product_crops)
+            }
+            for future in as_completed(futures):
+                product_id, product_results = future.result()
+                results[product_id] = product_results
+                update_progress(
+                    f"Created {len(product_results)} creatives for {futures[future].name}"
+                )
 
-            # Save
-            output_path = product_dir / f"{ratio_name}.png"
-            final_image.convert("RGB").save(output_path, "PNG")
-            product_results.append(str(output_path))
-
-        results[product.id] = product_results
+        # Keep the log and return value in brief order
+        results = {p.id: results[p.id] for p in brief.products}
 
     # Save generation log
     log_data = {
@@ -148,4 +279,7 @@ def generate_campaign_creatives(
     with open(log_path, "w") as f:
         json.dump(log_data, f, indent=2)
 
+    # Text layout is memoized per campaign message; don't carry it over
+    clear_text_caches()
+
     return results
@@ -0,0 +1,118 @@
+"""
+Layout math - places overlay elements at named positions within safe margins.
+"""
+
+import functools
+from enum import Enum
+from typing import Tuple, Union
+
+
+class Position(str, Enum):
+    """Named anchor positions on a 3x3 grid."""
+
+    TOP_LEFT = "top-left"
+    TOP_CENTER = "top-center"
+    TOP_RIGHT = "top-right"
+    CENTER_LEFT = "center-left"
+    CENTER = "center"
+    CENTER_RIGHT = "center-right"
+    BOTTOM_LEFT = "bottom-left"
+    BOTTOM_CENTER = "bottom-center"
+    BOTTOM_RIGHT = "bottom-right"
+
+
+# (horizontal, vertical) alignment per position
+_ALIGNMENTS = {
+    Position.TOP_LEFT: ("left", "top"),
+    Position.TOP_CENTER: ("center", "top"),
+    Position.TOP_RIGHT: ("right", "top"),
+    Position.CENTER_LEFT: ("left", "center"),
+    Position.CENTER: ("center", "center"),
+    Position.CENTER_RIGHT: ("right", "center"),
+    Position.BOTTOM_LEFT: ("left", "bottom"),
+    Position.BOTTOM_CENTER: ("center", "bottom"),
+    Position.BOTTOM_RIGHT: ("right", "bottom"),
+}
+
+# Offset along one axis given (free space, margin); "left"/"top" share the
+# leading rule and "right"/"bottom" the trailing one
+_OFFSETS = {
+    "left": lambda free, margin: margin,
+    "top": lambda free, margin: margin,
+    "center": lambda free, margin: free // 2,
+    "right": lambda free, margin: free - margin,
+    "bottom": lambda free, margin: free - margin,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def parse_position(name: str) -> Position:
+    """
+    Resolve a position name to a Position.
+
+    Exact names are looked up directly; other spellings (e.g. "center-top")
+    fall back to matching "left"/"right"/"top"/"bottom" anywhere in the name,
+    with anything unmatched treated as centered.
+
+    Args:
+        name: Position name from the layout rules
+
+    Returns:
+        Matching Position
+    """
+    try:
+        return Position(name)
+    except ValueError:
+        pass
+
+    horizontal = "left" if "left" in name else "right" if "right" in name else None
+    vertical = "top" if "top" in name else "bottom" if "bottom" in name else None
+    if horizontal is None and vertical is None:
+        return Position.CENTER
+    return Position(f"{vertical or 'center'}-{horizontal or 'center'}")
+
+
+class LayoutSolver:
+    """Places boxes at named positions within an image's safe margins."""
+
+    def __init__(self, width: int, height: int, margin_percent: float):
+        """
+        Args:
+            width: Image width in pixels
+            height: Image height in pixels
+            margin_percent: Safe margin from edges as percentage of image size
+        """
+        self.width = width
+        self.height = height
+        self.margin_x = int(width * margin_percent / 100)
+        self.margin_y = int(height * margin_percent / 100)
+
+    def place(
+        self, box_width: int, box_height: int, position: Union[Position, str]
+    ) -> Tuple[int, int]:
+        """
+        Top-left corner for a box at a named position.
+
+        x is kept inside the horizontal margins; y is not clamped, so a box
+        taller than the image overhangs evenly when centered.
+
+        Args:
+            box_width: Box width in pixels
+            box_height: Box height in pixels
+            position: Position, or a position name ("top-left", etc.)
+
+        Returns:
+            (x, y) of the box's top-left corner
+        """
+        if not isinstance(position, Position):
+            position = parse_position(position)
+        horizontal, vertical = _ALIGNMENTS[position]
+        free_x = self.width - box_width
+        free_y = self.height - box_height
+
+        x = _OFFSETS[horizontal](free_x, self.margin_x)
+        y = _OFFSETS[vertical](free_y, self.margin_y)
+
+        # Ensure x stays within bounds
+        x = max(self.margin_x, min(x, free_x - self.margin_x))
+        return x, y
@@ -1,11 +1,20 @@
 """
 Pydantic models for campaign briefs and brand configuration.
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, model_validator
+
+from .layout import Position, parse_position
+
+
+def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
+    """Parse a "#RRGGBB" color string into an RGB tuple."""
+    value = hex_color.lstrip("#")
+    return tuple(int(value[i : i + 2], 16) for i in (0, 2, 4))
 
 
 class Product(BaseModel):
     """A product to feature in the campaign."""
+    model_config = ConfigDict(frozen=True)
     id: str
     name: str
     description: str
@@ -14,6 +23,7 @@ class Product(BaseModel):
 
 class CampaignBrief(BaseModel):
     """Campaign brief containing all inputs for creative generation."""
+    model_config = ConfigDict(frozen=True)
     campaign_name: str
     products: list[Product]
     target_region: str
@@ -23,18 +33,58 @@ class CampaignBrief(BaseModel):
 
 class LayoutRules(BaseModel):
     """Rules for positioning brand elements."""
+    model_config = ConfigDict(frozen=True)
     logo_position: str = "bottom-right"
     logo_max_width_percent: float = 15.0
     text_position: str = "top-left"
     safe_margin_percent: float = 5.0
     text_background_opacity: float = 0.75
+    _logo_anchor: Position = Position.BOTTOM_RIGHT
+    _text_anchor: Position = Position.TOP_LEFT
+
+    @model_validator(mode="after")
+    def _parse_positions(self) -> "LayoutRules":
+        """Resolve position names once at load time."""
+        self._logo_anchor = parse_position(self.logo_position)
+        self._text_anchor = parse_position(self.text_position)
+        return self
+
+    @property
+    def logo_anchor(self) -> Position:
+        """Parsed logo position."""
+        return self._logo_anchor
+
+    @property
+    def text_anchor(self) -> Position:
+        """Parsed text position."""
+        return self._text_anchor
 
 
 class BrandConfig(BaseModel):
     """Brand configuration for consistent styling."""
+    model_config = ConfigDict(frozen=True)
     brand_name: str
     colors: dict[str, str]
     typography: dict[str, str]
     logos: dict[str, str]
     layout_rules: LayoutRules
+    _text_rgb: tuple[int, int, int] = (255, 255, 255)
+    _bg_rgb: tuple[int, int, int] = (0, 0, 0)
+
+    @model_validator(mode="after")
+    def _parse_colors(self) -> "BrandConfig":
+        """Parse overlay text/background colors once at load time."""
+        self._text_rgb = _hex_to_rgb(self.colors.get("text_light", "#FFFFFF"))
+        self._bg_rgb = _hex_to_rgb(self.colors.get("secondary", "#000000"))
+        return self
+
+    @property
+    def text_rgb(self) -> tuple[int, int, int]:
+        """RGB color for overlay text."""
+        return self._text_rgb
+
+    @property
+    def bg_rgb(self) -> tuple[int, int, int]:
+        """RGB color for the overlay text background."""
+        return self._bg_rgb
 